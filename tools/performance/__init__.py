@@ -0,0 +1 @@
+"""Performance benchmarking toolkit for the Geospatial Incident Platform."""